@@ -12,28 +12,71 @@ from .const import (
     APPLIANCE_TYPES,
     CONF_APPLIANCE_TYPE,
     CONF_DOOR_SENSOR,
+    CONF_EXTRA_SENSORS,
     CONF_POWER_SENSOR,
+    CONF_PRICE_SENSOR,
     DEFAULT_PROFILES,
     DOMAIN,
 )
 
 
+def _numeric_sources(sources: list) -> list[dict]:
+    """Return extra sources whose scale or threshold can be set.
+
+    Plain entity ids are converted to dicts in place so the settings can
+    be stored on them.
+    """
+    for index, source in enumerate(sources):
+        if not isinstance(source, dict):
+            sources[index] = {"entity_id": source}
+    return [
+        source
+        for source in sources
+        if str(source.get("entity_id", "")).startswith("sensor.")
+    ]
+
+
+def _source_schema(source: dict) -> vol.Schema:
+    positive = vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False))
+    return vol.Schema(
+        {
+            vol.Required("scale", default=source.get("scale") or 1.0): positive,
+            vol.Optional(
+                "threshold",
+                description={"suggested_value": source.get("threshold")},
+            ): positive,
+        }
+    )
+
+
 class ApplianceCycleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        self._title: str | None = None
+        self._data: dict = {}
+        self._sources: list[dict] = []
+
     async def async_step_user(self, user_input=None):
         if user_input is not None:
             profile = DEFAULT_PROFILES[user_input[CONF_APPLIANCE_TYPE]].copy()
-            data = {
+            extra = [
+                {"entity_id": entity_id}
+                for entity_id in user_input.get(CONF_EXTRA_SENSORS, [])
+            ]
+            self._data = {
                 CONF_APPLIANCE_TYPE: user_input[CONF_APPLIANCE_TYPE],
                 CONF_POWER_SENSOR: user_input[CONF_POWER_SENSOR],
                 CONF_DOOR_SENSOR: user_input.get(CONF_DOOR_SENSOR),
+                CONF_PRICE_SENSOR: user_input.get(CONF_PRICE_SENSOR),
+                CONF_EXTRA_SENSORS: extra,
                 "profile": profile,
             }
-            title = user_input["name"]
-            return self.async_create_entry(title=title, data=data)
+            self._title = user_input["name"]
+            self._sources = _numeric_sources(extra)
+            return await self.async_step_source()
 
         schema = vol.Schema(
             {
@@ -45,10 +88,36 @@ class ApplianceCycleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_DOOR_SENSOR): selector(
                     {"entity": {"domain": ["binary_sensor"]}}
                 ),
+                vol.Optional(CONF_EXTRA_SENSORS): selector(
+                    {
+                        "entity": {
+                            "domain": ["sensor", "binary_sensor"],
+                            "multiple": True,
+                        }
+                    }
+                ),
+                vol.Optional(CONF_PRICE_SENSOR): selector(
+                    {"entity": {"domain": ["sensor", "input_number"]}}
+                ),
             }
         )
         return self.async_show_form(step_id="user", data_schema=schema)
 
+    async def async_step_source(self, user_input=None):
+        """Ask how each numeric activity sensor maps to activity."""
+        if user_input is not None:
+            source = self._sources.pop(0)
+            source["scale"] = user_input["scale"]
+            source["threshold"] = user_input.get("threshold")
+        if not self._sources:
+            return self.async_create_entry(title=self._title, data=self._data)
+        source = self._sources[0]
+        return self.async_show_form(
+            step_id="source",
+            data_schema=_source_schema(source),
+            description_placeholders={"entity_id": source["entity_id"]},
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -60,11 +129,22 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     def __init__(self, config_entry):
         self.config_entry = config_entry
+        self._data: dict = {}
+        self._sources: list[dict] = []
 
     async def async_step_init(self, user_input=None):
         if user_input is not None:
-            self.config_entry.data["profile"].update(user_input)
-            return self.async_create_entry(title="", data={})
+            data = self.config_entry.data
+            self._data = {
+                **data,
+                "profile": {**(data.get("profile") or {}), **user_input},
+                CONF_EXTRA_SENSORS: [
+                    dict(source) if isinstance(source, dict) else source
+                    for source in data.get(CONF_EXTRA_SENSORS) or []
+                ],
+            }
+            self._sources = _numeric_sources(self._data[CONF_EXTRA_SENSORS])
+            return await self.async_step_source()
         profile = DEFAULT_PROFILES[
             self.config_entry.data[CONF_APPLIANCE_TYPE]
         ].copy()
@@ -94,3 +174,23 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_source(self, user_input=None):
+        """Adjust how each numeric activity sensor maps to activity."""
+        if user_input is not None:
+            source = self._sources.pop(0)
+            source["scale"] = user_input["scale"]
+            source["threshold"] = user_input.get("threshold")
+        if not self._sources:
+            # Settings live in the entry data; storing them triggers the
+            # update listener, which reloads the entry to apply them.
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data=self._data
+            )
+            return self.async_create_entry(title="", data={})
+        source = self._sources[0]
+        return self.async_show_form(
+            step_id="source",
+            data_schema=_source_schema(source),
+            description_placeholders={"entity_id": source["entity_id"]},
+        )
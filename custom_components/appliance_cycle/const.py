@@ -6,8 +6,18 @@ DOMAIN = "appliance_cycle"
 
 CONF_POWER_SENSOR = "power_sensor"
 CONF_DOOR_SENSOR = "door_sensor"
+CONF_PRICE_SENSOR = "price_sensor"
+CONF_EXTRA_SENSORS = "extra_sensors"
 CONF_APPLIANCE_TYPE = "appliance_type"
 
+EVENT_CYCLE_STARTED = "appliance_cycle_started"
+EVENT_CYCLE_FINISHED = "appliance_cycle_finished"
+EVENT_CYCLE_DOOR_OPENED = "appliance_cycle_door_opened_after_finish"
+EVENT_CYCLE_ABORTED = "appliance_cycle_aborted_min_run"
+
+END_REASON_POWER = "power_off"
+END_REASON_DOOR = "door_opened"
+
 APPLIANCE_TYPES = ["washer", "dryer", "dishwasher"]
 
 DEFAULT_PROFILES = {
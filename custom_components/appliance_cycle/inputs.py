@@ -0,0 +1,159 @@
+"""Input sources feeding the appliance cycle detector."""
+
+from __future__ import annotations
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import State
+
+ROLE_POWER = "power"
+ROLE_DOOR = "door"
+ROLE_PRICE = "price"
+ROLE_SIGNAL = "signal"
+
+
+def power_to_w(state: State) -> float | None:
+    """Return power in watts from a state object."""
+    try:
+        power = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    unit = state.attributes.get("unit_of_measurement")
+    if isinstance(unit, str):
+        unit = unit.lower()
+        if unit == "kw":
+            power *= 1000
+        elif unit == "mw":
+            power *= 1_000_000
+        elif unit == "gw":
+            power *= 1_000_000_000
+    return power
+
+
+# Currency sub-units used in price units such as ``c/kWh`` or ``øre/kWh``.
+PRICE_SUBUNITS = {"c", "ct", "cent", "cents", "p", "øre", "öre", "ore"}
+
+
+def _price_unit(state: State) -> tuple[str, str] | None:
+    """Return the (currency, energy) parts of a price unit."""
+    unit = state.attributes.get("unit_of_measurement")
+    if not isinstance(unit, str) or "/" not in unit:
+        return None
+    currency, _, energy = unit.partition("/")
+    return currency.strip(), energy.strip().lower()
+
+
+def price_per_kwh(state: State) -> float | None:
+    """Return price per kWh in the main currency unit from a state object."""
+    try:
+        price = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    unit = _price_unit(state)
+    if unit is None:
+        return price
+    currency, energy = unit
+    if energy == "wh":
+        price *= 1000
+    elif energy == "mwh":
+        price /= 1000
+    if currency.lower() in PRICE_SUBUNITS:
+        price /= 100
+    return price
+
+
+def price_currency(state: State) -> str | None:
+    """Return the ISO currency code of a price unit such as ``NOK/kWh``.
+
+    Returns None when the unit names no currency code, e.g. a symbol or a
+    sub-unit, since those cannot be checked against the configured one.
+    """
+    unit = _price_unit(state)
+    if unit is None:
+        return None
+    currency = unit[0]
+    if len(currency) != 3 or not currency.isascii() or not currency.isalpha():
+        return None
+    return currency.upper()
+
+
+def _positive_float(value) -> float | None:
+    """Return ``value`` as a positive float, or None if it is not one."""
+    try:
+        value = float(value)
+    except (ValueError, TypeError):
+        return None
+    return value if value > 0 else None
+
+
+class InputSource:
+    """One entity feeding the detector and how to read its state.
+
+    Activity signals (vibration, current clamp, water flow) are mapped to
+    a watt equivalent so they can be compared against the profile
+    thresholds alongside the power sensor. Binary sensors read as the on
+    threshold while on. Numeric sensors are multiplied by ``scale``, or,
+    when ``threshold`` is set, read as the on threshold at or above it
+    and as zero below it.
+    """
+
+    def __init__(
+        self,
+        entity_id: str,
+        role: str,
+        scale: float | None = None,
+        threshold: float | None = None,
+    ) -> None:
+        self.entity_id = entity_id
+        self.role = role
+        self.scale = scale
+        self.threshold = threshold
+
+    def value(self, state: State, on_value: float) -> float | None:
+        """Return the watt equivalent of a state, or None if unusable."""
+        if self.role == ROLE_POWER:
+            return power_to_w(state)
+        if state.state == STATE_ON:
+            return on_value
+        if state.state == STATE_OFF:
+            return 0.0
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError):
+            return None
+        if self.threshold is not None:
+            return on_value if value >= self.threshold else 0.0
+        return value * (self.scale if self.scale is not None else 1.0)
+
+
+def build_sources(
+    power_entity: str,
+    door_entity: str | None,
+    price_entity: str | None,
+    extra: list | None,
+) -> dict[str, InputSource]:
+    """Return input sources keyed by entity id.
+
+    Extra sources may be given as entity ids or as dicts with
+    ``entity_id`` and optional ``scale`` and ``threshold``. Settings that
+    are not positive numbers are ignored.
+    """
+    sources = {power_entity: InputSource(power_entity, ROLE_POWER)}
+    if door_entity:
+        sources[door_entity] = InputSource(door_entity, ROLE_DOOR)
+    if price_entity:
+        sources[price_entity] = InputSource(price_entity, ROLE_PRICE)
+    for item in extra or []:
+        if isinstance(item, dict):
+            entity_id = item.get("entity_id")
+            scale = _positive_float(item.get("scale"))
+            threshold = _positive_float(item.get("threshold"))
+        else:
+            entity_id, scale, threshold = item, None, None
+        if not isinstance(entity_id, str) or not entity_id:
+            continue
+        if entity_id in sources:
+            continue
+        sources[entity_id] = InputSource(
+            entity_id, ROLE_SIGNAL, scale, threshold
+        )
+    return sources
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta
 
 from homeassistant.const import STATE_ON
-from homeassistant.core import HomeAssistant, callback, Event, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.event import (
     async_call_later,
     async_track_state_change_event,
@@ -18,11 +25,30 @@ from homeassistant.util.dt import utcnow
 from .const import (
     CONF_APPLIANCE_TYPE,
     CONF_DOOR_SENSOR,
+    CONF_EXTRA_SENSORS,
     CONF_POWER_SENSOR,
+    CONF_PRICE_SENSOR,
     DEFAULT_PROFILES,
     DOMAIN,
+    END_REASON_DOOR,
+    END_REASON_POWER,
+    EVENT_CYCLE_ABORTED,
+    EVENT_CYCLE_DOOR_OPENED,
+    EVENT_CYCLE_FINISHED,
+    EVENT_CYCLE_STARTED,
+)
+from .inputs import (
+    ROLE_DOOR,
+    ROLE_POWER,
+    ROLE_PRICE,
+    InputSource,
+    build_sources,
+    price_currency,
+    price_per_kwh,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class ApplianceCycleManager:
     """Class handling state machine for one appliance."""
@@ -35,6 +61,13 @@ class ApplianceCycleManager:
         self.appliance_type: str = data[CONF_APPLIANCE_TYPE]
         self.power_entity: str = data[CONF_POWER_SENSOR]
         self.door_entity: str | None = data.get(CONF_DOOR_SENSOR)
+        self.price_entity: str | None = data.get(CONF_PRICE_SENSOR)
+        self.inputs: dict[str, InputSource] = build_sources(
+            self.power_entity,
+            self.door_entity,
+            self.price_entity,
+            data.get(CONF_EXTRA_SENSORS),
+        )
         defaults = DEFAULT_PROFILES[self.appliance_type].copy()
         stored_profile = data.get("profile")
         if isinstance(stored_profile, dict):
@@ -50,14 +83,23 @@ class ApplianceCycleManager:
         self.last_runtime: float | None = None
         self.door_is_open: bool | None = None
         self.door_last_opened: datetime | None = None
+        self.cycle_energy_wh: float = 0.0
+        self.cycle_cost: float = 0.0
+        self.cost_unit: str = hass.config.currency
+        self.last_cycle: dict | None = None
 
         self._on_timer = None
         self._off_timer = None
         self._on_grace_timer = None
+        self._reset_timer = None
         self._ticker_unsub = None
-        self._power_unsub = None
-        self._door_unsub = None
+        self._inputs_unsub = None
+        self._input_values: dict[str, float] = {}
         self._last_power: float | None = None
+        self._last_signal: float | None = None
+        self._last_price: float | None = None
+        self._price_currency_checked = False
+        self._energy_accounted_until: datetime | None = None
         self._start_candidate_started: datetime | None = None
         self._start_candidate_accounted_until: datetime | None = None
         self._start_candidate_high_duration: float = 0.0
@@ -73,44 +115,116 @@ class ApplianceCycleManager:
 
     async def async_setup(self) -> None:
         """Set up listeners."""
-        self._power_unsub = async_track_state_change_event(
-            self.hass, [self.power_entity], self._power_changed
+        self._inputs_unsub = async_track_state_change_event(
+            self.hass, list(self.inputs), self._input_changed
         )
-        if self.door_entity:
-            self._door_unsub = async_track_state_change_event(
-                self.hass, [self.door_entity], self._door_changed
-            )
-            door_state = self.hass.states.get(self.door_entity)
-            if door_state and door_state.state not in ("unknown", "unavailable"):
-                self.door_is_open = door_state.state == STATE_ON
+        for source in self.inputs.values():
+            state = self.hass.states.get(source.entity_id)
+            if not state or state.state in ("unknown", "unavailable"):
+                continue
+            if source.role == ROLE_DOOR:
+                self.door_is_open = state.state == STATE_ON
                 if self.door_is_open:
-                    self.door_last_opened = door_state.last_changed
-        power_state = self.hass.states.get(self.power_entity)
-        if power_state and power_state.state not in ("unknown", "unavailable"):
-            power = self._power_to_w(power_state)
-            if power is not None:
-                self._last_power = power
+                    self.door_last_opened = state.last_changed
+            elif source.role == ROLE_PRICE:
+                self._update_price(state)
+            else:
+                self._store_signal(source, state)
         self._ticker_unsub = async_track_time_interval(
             self.hass, self._handle_tick, timedelta(seconds=60)
         )
 
     async def async_unload(self) -> None:
         """Remove listeners."""
-        if self._power_unsub:
-            self._power_unsub()
-        if self._door_unsub:
-            self._door_unsub()
+        if self._inputs_unsub:
+            self._inputs_unsub()
+            self._inputs_unsub = None
         if self._ticker_unsub:
             self._ticker_unsub()
+            self._ticker_unsub = None
         self._cancel_on_timer()
         self._cancel_on_grace_timer()
+        self._cancel_reset_timer()
         if self._off_timer:
             self._off_timer()
+            self._off_timer = None
 
     @callback
     def _schedule_update(self) -> None:
         async_dispatcher_send(self.hass, self.update_signal)
 
+    def _fire_event(self, event_type: str, data: dict) -> None:
+        self.hass.bus.async_fire(event_type, data)
+
+    def _cycle_summary(
+        self, end: datetime | None, runtime: float | None, reason: str | None
+    ) -> dict:
+        """Return the event payload describing the current cycle."""
+        return {
+            "entry_id": self.entry.entry_id,
+            "name": self.name,
+            "appliance_type": self.appliance_type,
+            "started_at": (
+                self.started_at.isoformat() if self.started_at else None
+            ),
+            "finished_at": end.isoformat() if end else None,
+            "runtime_seconds": runtime,
+            "energy_kwh": round(self.cycle_energy_wh / 1000, 4),
+            "cost": (
+                round(self.cycle_cost, 4) if self.price_entity else None
+            ),
+            "cost_unit": self.cost_unit if self.price_entity else None,
+            "end_reason": reason,
+        }
+
+    def _pending_energy_wh(self, now: datetime) -> float:
+        """Return energy used since the last accounted point."""
+        if self._energy_accounted_until is None or self._last_power is None:
+            return 0.0
+        duration = (now - self._energy_accounted_until).total_seconds()
+        if duration <= 0:
+            return 0.0
+        return self._last_power * duration / 3600
+
+    def _accumulate_energy(self, now: datetime) -> None:
+        """Integrate power and price up to ``now`` during a cycle.
+
+        Accounting starts with the start candidate, so the delay_on window
+        is integrated as it happens rather than back-dated on confirmation.
+        Called before either the power or the price changes, so every
+        interval is charged at the price that was valid during it.
+        """
+        if (
+            self._energy_accounted_until is None
+            or now <= self._energy_accounted_until
+        ):
+            return
+        energy_wh = self._pending_energy_wh(now)
+        self.cycle_energy_wh += energy_wh
+        if self._last_price is not None:
+            self.cycle_cost += energy_wh / 1000 * self._last_price
+        self._energy_accounted_until = now
+
+    def _end_cycle(self, now: datetime, reason: str) -> bool:
+        """Finish the running cycle, or abort it if shorter than min_run."""
+        if self.started_at is None:
+            return False
+        self._accumulate_energy(now)
+        runtime = (now - self.started_at).total_seconds()
+        if runtime < self.profile["min_run"]:
+            self._fire_event(
+                EVENT_CYCLE_ABORTED, self._cycle_summary(now, runtime, reason)
+            )
+            self._reset_cycle()
+            return False
+        self.state = "finished"
+        self.finished_at = now
+        self.last_runtime = runtime
+        self._energy_accounted_until = None
+        self.last_cycle = self._cycle_summary(now, runtime, reason)
+        self._fire_event(EVENT_CYCLE_FINISHED, self.last_cycle)
+        return True
+
     def _cancel_on_timer(self) -> None:
         if self._on_timer:
             cancel = self._on_timer
@@ -124,11 +238,40 @@ class ApplianceCycleManager:
             if not from_callback:
                 cancel()
 
+    def _cancel_reset_timer(self, *, from_callback: bool = False) -> None:
+        if self._reset_timer:
+            cancel = self._reset_timer
+            self._reset_timer = None
+            if not from_callback:
+                cancel()
+
+    def _call_later(self, now: datetime, delay: float, action) -> CALLBACK_TYPE:
+        """Schedule ``action`` ``delay`` seconds after ``now``.
+
+        The action receives the deadline on the event timeline rather than
+        the wall-clock time the loop happens to run it at.
+        """
+        when = now + timedelta(seconds=delay)
+
+        @callback
+        def _fire(_fired: datetime) -> None:
+            action(when)
+
+        return async_call_later(self.hass, delay, _fire)
+
+    def _schedule_reset(self) -> None:
+        self._cancel_reset_timer()
+        self._reset_timer = async_call_later(
+            self.hass, self.profile["resume_grace"], self._reset_cycle
+        )
+
     @callback
     def _cancel_start_candidate(self, *_args) -> None:
         self._cancel_on_grace_timer(from_callback=bool(_args))
         self._cancel_on_timer()
         self._reset_start_candidate_state()
+        if self.state != "running":
+            self._energy_accounted_until = None
 
     def _reset_start_candidate_state(self) -> None:
         self._start_candidate_started = None
@@ -140,16 +283,19 @@ class ApplianceCycleManager:
         if (
             self._start_candidate_started is None
             or self._start_candidate_accounted_until is None
-            or self._last_power is None
         ):
             return
         if now <= self._start_candidate_accounted_until:
             return
+        if self._last_signal is None:
+            # No source is available; skip the gap rather than guess.
+            self._start_candidate_accounted_until = now
+            return
         duration = (now - self._start_candidate_accounted_until).total_seconds()
         if duration <= 0:
             self._start_candidate_accounted_until = now
             return
-        if self._last_power >= self.profile["on_threshold"]:
+        if self._last_signal >= self.profile["on_threshold"]:
             self._start_candidate_high_duration += duration
             self._start_candidate_below_duration = 0.0
         else:
@@ -161,43 +307,86 @@ class ApplianceCycleManager:
         self._start_candidate_accounted_until = now
 
     @staticmethod
-    def _power_to_w(state: State) -> float | None:
-        """Return power in watts from a state object."""
-        try:
-            power = float(state.state)
-        except (ValueError, TypeError):
-            return None
-        unit = state.attributes.get("unit_of_measurement")
-        if isinstance(unit, str):
-            unit = unit.lower()
-            if unit == "kw":
-                power *= 1000
-            elif unit == "mw":
-                power *= 1_000_000
-            elif unit == "gw":
-                power *= 1_000_000_000
-        return power
-
-    @callback
-    def _power_changed(self, event: Event) -> None:
-        new_state: State | None = event.data.get("new_state")
-        if new_state is None or new_state.state in ("unknown", "unavailable"):
-            return
-        event_time: datetime | None = new_state.last_changed
+    def _event_time(event: Event, state: State) -> datetime:
+        """Return when a state change happened.
+
+        Event handlers use the state timestamp and timer callbacks the
+        time they were scheduled for, so the state machine never mixes
+        wall-clock reads with event time. ``last_updated`` is used since
+        ``last_changed`` stays put on attribute-only updates.
+        """
+        event_time: datetime | None = state.last_updated
         if event_time is None:
             event_time = getattr(event, "time_fired", None)
         if event_time is None:
             event_time = utcnow()
+        return event_time
+
+    @callback
+    def _input_changed(self, event: Event) -> None:
+        """Route a state change from any input source.
+
+        All sources share one listener, so their changes arrive as a
+        single time-ordered stream regardless of how many are configured.
+        """
+        source = self.inputs.get(event.data.get("entity_id"))
+        new_state: State | None = event.data.get("new_state")
+        if source is None or new_state is None:
+            return
+        event_time = self._event_time(event, new_state)
+        if source.role not in (ROLE_DOOR, ROLE_PRICE):
+            self._signal_changed(source, new_state, event_time)
+        elif new_state.state in ("unknown", "unavailable"):
+            return
+        elif source.role == ROLE_DOOR:
+            old_state: State | None = event.data.get("old_state")
+            if old_state is not None and old_state.state == new_state.state:
+                # Attribute-only update, e.g. a battery level report.
+                return
+            self._door_changed(new_state, event_time)
+        else:
+            self._price_changed(new_state, event_time)
+
+    def _store_signal(self, source: InputSource, state: State) -> bool:
+        """Record a source value and recompute the combined signal.
+
+        A source that becomes unknown or unavailable drops out of the
+        combined signal instead of holding its last value forever.
+        """
+        if state.state in ("unknown", "unavailable"):
+            value = None
+        else:
+            value = source.value(state, self.profile["on_threshold"])
+            if value is None:
+                return False
+        if source.role == ROLE_POWER:
+            self._last_power = value
+        if value is None:
+            if self._input_values.pop(source.entity_id, None) is None:
+                return False
+        else:
+            self._input_values[source.entity_id] = value
+        self._last_signal = (
+            max(self._input_values.values()) if self._input_values else None
+        )
+        return self._last_signal is not None
+
+    def _signal_changed(
+        self, source: InputSource, new_state: State, event_time: datetime
+    ) -> None:
         self._advance_start_candidate(event_time)
-        power = self._power_to_w(new_state)
-        if power is None:
+        self._accumulate_energy(event_time)
+        if not self._store_signal(source, new_state):
             return
-        self._last_power = power
+        signal = self._last_signal
 
         if self.state == "idle":
             on_threshold = self.profile["on_threshold"]
-            if power >= on_threshold:
+            if signal >= on_threshold:
                 if self._start_candidate_started is None:
+                    self.cycle_energy_wh = 0.0
+                    self.cycle_cost = 0.0
+                    self._energy_accounted_until = event_time
                     self._start_candidate_started = event_time
                     self._start_candidate_accounted_until = event_time
                     self._start_candidate_high_duration = 0.0
@@ -218,8 +407,8 @@ class ApplianceCycleManager:
                     if remaining <= 0:
                         self._confirm_running(event_time)
                     else:
-                        self._on_timer = async_call_later(
-                            self.hass, remaining, self._confirm_running
+                        self._on_timer = self._call_later(
+                            event_time, remaining, self._confirm_running
                         )
             elif self._on_timer:
                 start_grace = self.profile.get("start_grace", 0)
@@ -233,43 +422,72 @@ class ApplianceCycleManager:
                 else:
                     self._cancel_start_candidate()
 
-        if self.state == "running" and power <= self.profile["off_threshold"]:
+        if self.state == "running" and signal <= self.profile["off_threshold"]:
             if not self._off_timer:
                 delay = self.profile["delay_off"] + self.profile["quiet_end"]
-                self._off_timer = async_call_later(
-                    self.hass, delay, self._confirm_finished
+                self._off_timer = self._call_later(
+                    event_time, delay, self._confirm_finished
                 )
         else:
-            if self._off_timer and power > self.profile["off_threshold"]:
+            if self._off_timer and signal > self.profile["off_threshold"]:
                 self._off_timer()
                 self._off_timer = None
 
-    @callback
-    def _door_changed(self, event: Event) -> None:
-        new_state: State | None = event.data.get("new_state")
-        if new_state is None or new_state.state in ("unknown", "unavailable"):
+    def _update_price(self, state: State) -> None:
+        price = price_per_kwh(state)
+        if price is None:
             return
+        self._last_price = price
+        if not self._price_currency_checked:
+            self._check_price_currency(state)
+
+    def _check_price_currency(self, state: State) -> None:
+        """Warn once if prices are not in the configured currency.
+
+        Costs are labelled with the Home Assistant currency, so a price
+        in another currency would be shown under the wrong unit.
+        """
+        self._price_currency_checked = True
+        currency = price_currency(state)
+        if currency is not None and currency != self.cost_unit:
+            _LOGGER.warning(
+                "Price sensor %s reports prices in %s but Home Assistant "
+                "uses %s; cycle costs for %s are not converted and will be "
+                "shown in %s",
+                state.entity_id,
+                currency,
+                self.cost_unit,
+                self.name,
+                self.cost_unit,
+            )
+
+    def _price_changed(self, new_state: State, event_time: datetime) -> None:
+        self._accumulate_energy(event_time)
+        self._update_price(new_state)
+
+    def _door_changed(self, new_state: State, now: datetime) -> None:
         is_open = new_state.state == STATE_ON
         self.door_is_open = is_open
         if is_open:
-            self.door_last_opened = utcnow()
+            self.door_last_opened = now
             if self.state == "running":
                 if self._off_timer:
                     self._off_timer()
                     self._off_timer = None
                 if self.started_at:
-                    runtime = (utcnow() - self.started_at).total_seconds()
-                    if runtime < self.profile["min_run"]:
-                        self._reset_cycle()
+                    if not self._end_cycle(now, END_REASON_DOOR):
                         self._schedule_update()
                         return
-                    self.last_runtime = runtime
-                self.state = "finished"
-                self.finished_at = utcnow()
-                async_call_later(
-                    self.hass, self.profile["resume_grace"], self._reset_cycle
-                )
+                else:
+                    self.state = "finished"
+                    self.finished_at = now
+                self._schedule_reset()
             elif self.state == "finished":
+                if self.last_cycle is not None:
+                    self._fire_event(
+                        EVENT_CYCLE_DOOR_OPENED,
+                        {**self.last_cycle, "door_opened_at": now.isoformat()},
+                    )
                 self._reset_cycle()
         self._schedule_update()
 
@@ -282,13 +500,12 @@ class ApplianceCycleManager:
         self._advance_start_candidate(_now)
         if self._start_candidate_started is None:
             return
-        required = self.profile["delay_on"]
-        if self._start_candidate_high_duration < required:
-            remaining = required - self._start_candidate_high_duration
-            if remaining <= 0:
-                remaining = 1.0
-            self._on_timer = async_call_later(
-                self.hass, remaining, self._confirm_running
+        remaining = self.profile["delay_on"] - self._start_candidate_high_duration
+        # Summed intervals can fall short of the deadline by a float
+        # rounding error; rescheduling for that would never make progress.
+        if remaining > 1e-6:
+            self._on_timer = self._call_later(
+                _now, remaining, self._confirm_running
             )
             return
         start_time = self._start_candidate_started
@@ -298,31 +515,23 @@ class ApplianceCycleManager:
         if start_time:
             self.started_at = start_time
         else:
-            self.started_at = utcnow()
+            self.started_at = _now
+        self._accumulate_energy(_now)
+        self._fire_event(
+            EVENT_CYCLE_STARTED, self._cycle_summary(None, None, None)
+        )
         self._schedule_update()
 
     @callback
     def _confirm_finished(self, _now: datetime) -> None:
         self._off_timer = None
-        power_state = self.hass.states.get(self.power_entity)
-        if not power_state:
-            return
-        power = self._power_to_w(power_state)
-        if power is None or power > self.profile["off_threshold"]:
+        signal = self._last_signal
+        if signal is None or signal > self.profile["off_threshold"]:
             return
-        if self.started_at is None:
-            return
-        runtime = (utcnow() - self.started_at).total_seconds()
-        if runtime < self.profile["min_run"]:
-            self._reset_cycle()
+        if not self._end_cycle(_now, END_REASON_POWER):
             return
-        self.state = "finished"
-        self.finished_at = utcnow()
-        self.last_runtime = runtime
         if not self.door_entity:
-            async_call_later(
-                self.hass, self.profile["resume_grace"], self._reset_cycle
-            )
+            self._schedule_reset()
         self._schedule_update()
 
     @callback
@@ -336,9 +545,11 @@ class ApplianceCycleManager:
 
     @callback
     def _reset_cycle(self, *_args) -> None:
+        self._cancel_reset_timer(from_callback=bool(_args))
         self._cancel_start_candidate()
         self.state = "idle"
         self.started_at = None
+        self._energy_accounted_until = None
         self._schedule_update()
 
     # Properties used by entities
@@ -358,6 +569,21 @@ class ApplianceCycleManager:
             return self.finished_at.isoformat()
         return None
 
+    @property
+    def cost_so_far(self) -> float | None:
+        if not self.price_entity or self.state != "running":
+            return None
+        cost = self.cycle_cost
+        if self._last_price is not None:
+            cost += self._pending_energy_wh(utcnow()) / 1000 * self._last_price
+        return cost
+
+    @property
+    def last_cost(self) -> float | None:
+        if self.last_cycle is None:
+            return None
+        return self.last_cycle.get("cost")
+
     @property
     def door_open(self) -> bool | None:
         return self.door_is_open
@@ -19,6 +19,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
         ApplianceTimeSinceFinishedSensor(manager),
         ApplianceStatusSensor(manager),
     ]
+    if manager.price_entity:
+        sensors.append(ApplianceCycleCostSensor(manager))
+        sensors.append(ApplianceLastCycleCostSensor(manager))
     async_add_entities(sensors)
 
 
@@ -95,6 +98,37 @@ class ApplianceTimeSinceFinishedSensor(ApplianceBaseSensor):
         return int(self.manager.time_since_finished_seconds)
 
 
+class ApplianceCycleCostSensor(ApplianceBaseSensor):
+    _attr_device_class = SensorDeviceClass.MONETARY
+
+    def __init__(self, manager) -> None:
+        super().__init__(manager)
+        self._attr_name = f"{manager.name} Cycle Cost"
+        self._attr_unique_id = f"{manager.entry.entry_id}_cycle_cost"
+        self._attr_native_unit_of_measurement = manager.cost_unit
+
+    @property
+    def native_value(self):
+        cost = self.manager.cost_so_far
+        if cost is None:
+            return None
+        return round(cost, 4)
+
+
+class ApplianceLastCycleCostSensor(ApplianceBaseSensor):
+    _attr_device_class = SensorDeviceClass.MONETARY
+
+    def __init__(self, manager) -> None:
+        super().__init__(manager)
+        self._attr_name = f"{manager.name} Last Cycle Cost"
+        self._attr_unique_id = f"{manager.entry.entry_id}_last_cycle_cost"
+        self._attr_native_unit_of_measurement = manager.cost_unit
+
+    @property
+    def native_value(self):
+        return self.manager.last_cost
+
+
 class ApplianceStatusSensor(ApplianceBaseSensor):
     def __init__(self, manager) -> None:
         super().__init__(manager)
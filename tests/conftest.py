@@ -0,0 +1,42 @@
+"""Fixtures for appliance cycle tests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.appliance_cycle.const import (
+    CONF_APPLIANCE_TYPE,
+    CONF_POWER_SENSOR,
+)
+from custom_components.appliance_cycle.manager import ApplianceCycleManager
+
+from .fake_hass import FakeEntry, FakeHass
+
+START = datetime(2025, 9, 17, 16, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def hass():
+    fake = FakeHass(START)
+    restore = fake.install()
+    yield fake
+    restore()
+
+
+@pytest.fixture
+def make_manager(hass):
+    """Return a factory setting up a washer manager on the fake hass."""
+
+    def _make(**data) -> ApplianceCycleManager:
+        data.setdefault(CONF_APPLIANCE_TYPE, "washer")
+        data.setdefault(CONF_POWER_SENSOR, "sensor.washer_power")
+        manager = ApplianceCycleManager(
+            hass, FakeEntry("washer_entry", "Washer", data)
+        )
+        asyncio.run(manager.async_setup())
+        return manager
+
+    return _make
@@ -0,0 +1,435 @@
+"""Minimal Home Assistant stand-in driven by a virtual clock.
+
+Only the pieces the integration touches are provided: a state store, an
+event bus that records fired events, config entries that set up the
+real entity platforms, and replacements for the timer, state tracking
+and dispatcher helpers. Every timer, listener and dispatcher connection
+is counted so harnesses can check that nothing is left after unload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from homeassistant.core import Event, State
+from homeassistant.helpers import entity as entity_helper
+from homeassistant.helpers import entity_registry
+from homeassistant.util import slugify
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+import custom_components.appliance_cycle as integration
+from custom_components.appliance_cycle import manager as manager_module
+
+PATCHED_HELPERS = {
+    manager_module: (
+        "async_call_later",
+        "async_track_state_change_event",
+        "async_track_time_interval",
+        "async_dispatcher_send",
+        "utcnow",
+    ),
+}
+for _platform in integration.PLATFORMS:
+    _module = importlib.import_module(f"{integration.__name__}.{_platform}")
+    PATCHED_HELPERS[_module] = ("async_dispatcher_connect",)
+
+
+class FakeEntry:
+    """Config entry carrying just what the integration reads."""
+
+    def __init__(self, entry_id: str, title: str, data: dict) -> None:
+        self.entry_id = entry_id
+        self.title = title
+        self.data = data
+        self.options: dict = {}
+        self.update_listeners: list = []
+        self._on_unload: list = []
+
+    def add_update_listener(self, listener) -> callable:
+        self.update_listeners.append(listener)
+        return lambda: self.update_listeners.remove(listener)
+
+    def async_on_unload(self, func) -> None:
+        self._on_unload.append(func)
+
+
+class FakeStates:
+    """State store with the lookups and writes the integration uses."""
+
+    def __init__(self, hass: FakeHass) -> None:
+        self._hass = hass
+        self._states: dict[str, State] = {}
+        self.writes = 0
+
+    def get(self, entity_id: str) -> State | None:
+        return self._states.get(entity_id)
+
+    def async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes=None,
+        force_update: bool = False,
+        context=None,
+        state_info=None,
+    ) -> None:
+        self.writes += 1
+        self._hass.set_state(entity_id, new_state, dict(attributes or {}))
+
+    def async_remove(self, entity_id: str, context=None) -> bool:
+        return self._states.pop(entity_id, None) is not None
+
+
+class FakeEntityRegistry:
+    """Entity registry with nothing registered."""
+
+    def async_get_entity_id(self, domain, platform, unique_id) -> None:
+        return None
+
+
+class FakePlatform:
+    """Entity platform for one config entry and domain."""
+
+    def __init__(self, domain: str, entry: FakeEntry) -> None:
+        self.domain = domain
+        self.platform_name = integration.DOMAIN
+        self.config_entry = entry
+        self.entities: list = []
+
+
+class FakeConfigEntries:
+    """Config entry manager that sets up the real entity platforms."""
+
+    def __init__(self, hass: FakeHass) -> None:
+        self._hass = hass
+        self._entries: dict[str, FakeEntry] = {}
+        self._platforms: dict[str, list[FakePlatform]] = {}
+
+    def async_get_entry(self, entry_id: str) -> FakeEntry | None:
+        return self._entries.get(entry_id)
+
+    async def async_setup(self, entry: FakeEntry) -> bool:
+        self._entries[entry.entry_id] = entry
+        return await integration.async_setup_entry(self._hass, entry)
+
+    async def async_unload(self, entry: FakeEntry) -> bool:
+        unloaded = await integration.async_unload_entry(self._hass, entry)
+        while entry._on_unload:
+            entry._on_unload.pop()()
+        return unloaded
+
+    async def async_reload(self, entry_id: str) -> bool:
+        entry = self._entries[entry_id]
+        await self.async_unload(entry)
+        return await self.async_setup(entry)
+
+    def async_update_entry(
+        self, entry: FakeEntry, *, data=None, options=None
+    ) -> bool:
+        """Store new data or options and notify update listeners."""
+        changed = False
+        if data is not None and data != entry.data:
+            entry.data = data
+            changed = True
+        if options is not None and options != entry.options:
+            entry.options = options
+            changed = True
+        if changed:
+            for listener in list(entry.update_listeners):
+                self._hass.async_create_task(listener(self._hass, entry))
+        return changed
+
+    async def async_forward_entry_setups(
+        self, entry: FakeEntry, platforms
+    ) -> None:
+        for domain in platforms:
+            platform = FakePlatform(str(domain), entry)
+            self._platforms.setdefault(entry.entry_id, []).append(platform)
+            module = importlib.import_module(f"{integration.__name__}.{domain}")
+            added = []
+            await module.async_setup_entry(self._hass, entry, added.extend)
+            for entity in added:
+                entity.entity_id = f"{domain}.{slugify(entity.name)}"
+                entity.add_to_platform_start(self._hass, platform, None)
+                await entity.add_to_platform_finish()
+                platform.entities.append(entity)
+
+    async def async_unload_platforms(self, entry: FakeEntry, platforms) -> bool:
+        for platform in self._platforms.pop(entry.entry_id, []):
+            for entity in platform.entities:
+                await entity.async_remove()
+            platform.entities.clear()
+        return True
+
+    def entities(self, entry_id: str) -> list:
+        """Return the entities set up for an entry."""
+        return [
+            entity
+            for platform in self._platforms.get(entry_id, [])
+            for entity in platform.entities
+        ]
+
+
+class FakeBus:
+    """Event bus recording fired events."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict]] = []
+
+    def async_fire(self, event_type: str, data: dict | None = None) -> None:
+        self.events.append((event_type, dict(data or {})))
+
+    def of_type(self, event_type: str) -> list[dict]:
+        return [data for etype, data in self.events if etype == event_type]
+
+
+class _Timer:
+    __slots__ = ("deadline", "seq", "action", "interval", "active", "owner")
+
+    def __init__(self, deadline, seq, action, interval, owner) -> None:
+        self.deadline = deadline
+        self.seq = seq
+        self.action = action
+        self.interval = interval
+        self.active = True
+        self.owner = owner
+
+    def __lt__(self, other: _Timer) -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class FakeHass:
+    """Virtual-clock hass exposing the helpers the manager calls.
+
+    ``fire_skew`` and ``wall_skew`` shift the time handed to timer
+    callbacks and returned by ``utcnow`` away from the virtual clock, to
+    mimic a real loop where both are wall-clock readings.
+
+    Timers and listeners are attributed to ``owner``, which the driver
+    sets around setup and unload and which is inherited while a timer or
+    listener runs, so leaks can be traced to a single appliance.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        *,
+        fire_skew: float = 0.0,
+        wall_skew: float = 0.0,
+        currency: str = "EUR",
+    ) -> None:
+        self.now = start
+        self.states = FakeStates(self)
+        self.bus = FakeBus()
+        self.config = SimpleNamespace(currency=currency, units=METRIC_SYSTEM)
+        self.config_entries = FakeConfigEntries(self)
+        self.data: dict = {}
+        self.fire_skew = timedelta(seconds=fire_skew)
+        self.wall_skew = timedelta(seconds=wall_skew)
+        self.dispatched = 0
+        self.live_timers = 0
+        self.live_listeners = 0
+        self.live_connections = 0
+        self.state_events = 0
+        self.owner = None
+        self._owned: dict = {}
+        self._heap: list[_Timer] = []
+        self._seq = 0
+        self._listeners: dict[str, list] = {}
+        self._connections: dict[str, list] = {}
+        self._tasks: list = []
+        entity_helper.async_setup(self)
+        self.data[entity_registry.DATA_REGISTRY] = FakeEntityRegistry()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def async_create_task(self, target) -> None:
+        """Queue a coroutine; ``async_block_till_done`` runs it."""
+        self._tasks.append(target)
+
+    async def async_block_till_done(self) -> None:
+        while self._tasks:
+            await self._tasks.pop(0)
+
+    # Replacements for homeassistant helpers ---------------------------
+
+    def utcnow(self) -> datetime:
+        return self.now + self.wall_skew
+
+    def async_call_later(self, hass, delay, action):
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        # Like a real loop, a timer never fires in the tick it was set in.
+        step = max(timedelta(seconds=delay), timedelta(microseconds=1))
+        return self._schedule(self.now + step, action, None)
+
+    def async_track_time_interval(self, hass, action, interval):
+        return self._schedule(self.now + interval, action, interval)
+
+    def async_track_state_change_event(self, hass, entity_ids, action):
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        entity_ids = list(entity_ids)
+        listener = (self.owner, action)
+        for entity_id in entity_ids:
+            self._listeners.setdefault(entity_id, []).append(listener)
+        self.live_listeners += 1
+        self._count(self.owner, 1)
+        removed = False
+
+        def _unsub() -> None:
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            self.live_listeners -= 1
+            self._count(listener[0], -1)
+            for entity_id in entity_ids:
+                self._listeners[entity_id].remove(listener)
+
+        return _unsub
+
+    def async_dispatcher_connect(self, hass, signal, target):
+        connection = (self.owner, target)
+        self._connections.setdefault(signal, []).append(connection)
+        self.live_connections += 1
+        self._count(self.owner, 1)
+        removed = False
+
+        def _disconnect() -> None:
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            self.live_connections -= 1
+            self._count(connection[0], -1)
+            self._connections[signal].remove(connection)
+            if not self._connections[signal]:
+                del self._connections[signal]
+
+        return _disconnect
+
+    def async_dispatcher_send(self, hass, signal, *args) -> None:
+        self.dispatched += 1
+        for _owner, target in list(self._connections.get(signal, ())):
+            target(*args)
+
+    def owned(self, owner) -> int:
+        """Return live timers, listeners and connections of ``owner``."""
+        return self._owned.get(owner, 0)
+
+    def install(self) -> callable:
+        """Patch the integration's helpers; return a restore callable."""
+        originals = [
+            (module, name, getattr(module, name))
+            for module, names in PATCHED_HELPERS.items()
+            for name in names
+        ]
+        for module, name, _value in originals:
+            setattr(module, name, getattr(self, name))
+
+        def _restore() -> None:
+            for module, name, value in originals:
+                setattr(module, name, value)
+
+        return _restore
+
+    # Driving the simulation -------------------------------------------
+
+    def set_state(
+        self, entity_id: str, value, attributes: dict | None = None
+    ) -> None:
+        """Write a state and notify listeners like the real state machine."""
+        value = str(value)
+        attributes = attributes or {}
+        old_state = self.states.get(entity_id)
+        if (
+            old_state is not None
+            and old_state.state == value
+            and dict(old_state.attributes) == attributes
+        ):
+            return
+        last_changed = self.now
+        if old_state is not None and old_state.state == value:
+            last_changed = old_state.last_changed
+        new_state = State(
+            entity_id,
+            value,
+            attributes,
+            last_changed=last_changed,
+            last_updated=self.now,
+        )
+        self.states._states[entity_id] = new_state
+        event = Event(
+            "state_changed",
+            {
+                "entity_id": entity_id,
+                "old_state": old_state,
+                "new_state": new_state,
+            },
+            time_fired=self.now,
+        )
+        self.state_events += 1
+        # Entities write their state from inside manager callbacks, so
+        # the running owner is restored rather than cleared.
+        running = self.owner
+        for owner, action in list(self._listeners.get(entity_id, ())):
+            self.owner = owner
+            action(event)
+        self.owner = running
+
+    def advance_to(self, when: datetime) -> None:
+        """Fire due timers in deadline order and move the clock to ``when``."""
+        while self._heap and self._heap[0].deadline <= when:
+            timer = heapq.heappop(self._heap)
+            if not timer.active:
+                continue
+            self.now = timer.deadline
+            action = timer.action
+            if timer.interval is None:
+                timer.active = False
+                timer.action = None
+                self.live_timers -= 1
+                self._count(timer.owner, -1)
+            else:
+                timer.deadline = timer.deadline + timer.interval
+                heapq.heappush(self._heap, timer)
+            self.owner = timer.owner
+            action(self.now + self.fire_skew)
+            self.owner = None
+        if when > self.now:
+            self.now = when
+
+    def advance(self, seconds: float) -> None:
+        self.advance_to(self.now + timedelta(seconds=seconds))
+
+    def _schedule(self, deadline, action, interval):
+        self._seq += 1
+        timer = _Timer(deadline, self._seq, action, interval, self.owner)
+        heapq.heappush(self._heap, timer)
+        self.live_timers += 1
+        self._count(self.owner, 1)
+
+        def _cancel() -> None:
+            if timer.active:
+                timer.active = False
+                timer.action = None
+                self.live_timers -= 1
+                self._count(timer.owner, -1)
+
+        return _cancel
+
+    def _count(self, owner, delta: int) -> None:
+        if owner is None:
+            return
+        total = self._owned.get(owner, 0) + delta
+        if total:
+            self._owned[owner] = total
+        else:
+            self._owned.pop(owner, None)
@@ -0,0 +1,257 @@
+"""Randomised simulated-clock harness for the cycle state machine.
+
+Each trace is a random sequence of power, door and vibration reports,
+including attribute-only updates, fed to a fresh manager on a virtual
+clock with random profile timings. After every step the harness checks
+the state machine invariants; at the end it lets the appliance go
+quiet, checks nothing is stuck running, and checks unload leaves no
+timers or listeners behind. Every trace is run a second time on a hass
+whose timer fire times and wall clock are skewed, and both runs must
+agree exactly.
+
+The outcome of the first traces is recorded in ``fuzz_golden.json``
+and each run is compared against it, so an optimisation that changes
+behaviour is caught. Re-record only for an intended behaviour change:
+
+    python -m tests.fuzz --traces 100000
+    python -m tests.fuzz --traces 1000 --record
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from custom_components.appliance_cycle.const import (
+    CONF_APPLIANCE_TYPE,
+    CONF_DOOR_SENSOR,
+    CONF_EXTRA_SENSORS,
+    CONF_POWER_SENSOR,
+)
+from custom_components.appliance_cycle.manager import ApplianceCycleManager
+
+from .fake_hass import FakeEntry, FakeHass
+
+START = datetime(2025, 9, 17, 16, 0, tzinfo=timezone.utc)
+POWER = "sensor.fuzz_power"
+DOOR = "binary_sensor.fuzz_door"
+VIBRATION = "binary_sensor.fuzz_vibration"
+WATTS = {"unit_of_measurement": "W"}
+GOLDEN = Path(__file__).with_name("fuzz_golden.json")
+
+
+class InvariantError(AssertionError):
+    """Raised when a trace breaks a state machine invariant."""
+
+
+def random_profile(rng: random.Random) -> dict:
+    off_threshold = rng.choice([2.0, 5.0, 8.0])
+    return {
+        "on_threshold": off_threshold + rng.choice([1.0, 7.0, 20.0]),
+        "off_threshold": off_threshold,
+        "delay_on": rng.randint(0, 120),
+        "delay_off": rng.randint(0, 300),
+        "quiet_end": rng.randint(0, 120),
+        "min_run": rng.randint(0, 900),
+        "resume_grace": rng.randint(0, 240),
+        "start_grace": rng.choice([0, rng.randint(1, 60)]),
+    }
+
+
+def random_trace(rng: random.Random, length: int = 60) -> dict:
+    """Return a random trace: profile, optional inputs and timed reports.
+
+    A report with a value of None repeats the entity's current state with
+    a new battery attribute, the way sensors report attribute changes.
+    """
+    steps = []
+    for _ in range(length):
+        gap = rng.choice([0, 1, rng.uniform(0, 30), rng.uniform(0, 900)])
+        roll = rng.random()
+        if roll < 0.1:
+            steps.append((gap, DOOR, rng.choice(["on", "off"])))
+        elif roll < 0.2:
+            steps.append(
+                (gap, VIBRATION, rng.choice(["on", "off", "unavailable"]))
+            )
+        elif roll < 0.25:
+            steps.append((gap, POWER, rng.choice(["unavailable", "unknown"])))
+        elif roll < 0.35:
+            steps.append((gap, rng.choice([DOOR, VIBRATION, POWER]), None))
+        else:
+            watts = rng.choice(
+                [
+                    0.0,
+                    rng.uniform(0, 10),
+                    rng.uniform(0, 30),
+                    rng.uniform(100, 2500),
+                ]
+            )
+            steps.append((gap, POWER, round(watts, 2)))
+    return {
+        "profile": random_profile(rng),
+        "door": rng.random() < 0.5,
+        "vibration": rng.random() < 0.5,
+        "steps": steps,
+    }
+
+
+def _run(coro) -> None:
+    """Run a coroutine that never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    raise RuntimeError("coroutine suspended")
+
+
+def _check(manager: ApplianceCycleManager, now: datetime) -> None:
+    if manager.state not in ("idle", "running", "finished"):
+        raise InvariantError(f"unknown state {manager.state}")
+    if manager.state == "running":
+        if manager.started_at is None or manager.started_at > now:
+            raise InvariantError("running without a past started_at")
+    if (
+        manager.state == "finished"
+        and manager.started_at is not None
+        and manager.finished_at < manager.started_at
+    ):
+        raise InvariantError("finished_at before started_at")
+
+
+def run_trace(trace: dict, *, fire_skew: float = 0.0, wall_skew: float = 0.0):
+    """Run one trace, check invariants and return its observable result."""
+    hass = FakeHass(START, fire_skew=fire_skew, wall_skew=wall_skew)
+    restore = hass.install()
+    try:
+        data = {
+            CONF_APPLIANCE_TYPE: "washer",
+            CONF_POWER_SENSOR: POWER,
+            CONF_DOOR_SENSOR: DOOR if trace["door"] else None,
+            CONF_EXTRA_SENSORS: [VIBRATION] if trace["vibration"] else [],
+            "profile": dict(trace["profile"]),
+        }
+        manager = ApplianceCycleManager(hass, FakeEntry("fuzz", "Fuzz", data))
+        _run(manager.async_setup())
+        states = []
+        for gap, entity_id, value in trace["steps"]:
+            hass.advance(gap)
+            _check(manager, hass.now)
+            if entity_id == DOOR and not trace["door"]:
+                continue
+            if entity_id == VIBRATION and not trace["vibration"]:
+                continue
+            attributes = dict(WATTS) if entity_id == POWER else {}
+            current = hass.states.get(entity_id)
+            if value is None:
+                if current is None:
+                    continue
+                value = current.state
+                attributes["battery"] = current.attributes.get("battery", 100) - 1
+            elif current is not None and "battery" in current.attributes:
+                attributes["battery"] = current.attributes["battery"]
+            hass.set_state(entity_id, value, attributes)
+            _check(manager, hass.now)
+            states.append((manager.state, manager.started_at, manager.finished_at))
+
+        # Go quiet the way sensors do: report once more only if the last
+        # report was not already idle. An unavailable vibration sensor
+        # stays unavailable and must not keep the cycle running.
+        vibration = hass.states.get(VIBRATION)
+        if vibration is not None and vibration.state == "on":
+            hass.set_state(VIBRATION, "off", dict(vibration.attributes))
+        last = hass.states.get(POWER)
+        try:
+            quiet = float(last.state) <= trace["profile"]["off_threshold"]
+        except (AttributeError, ValueError):
+            quiet = False
+        if not quiet:
+            hass.set_state(POWER, 0.0, WATTS)
+        hass.advance(6 * 3600)
+        _check(manager, hass.now)
+        if manager.state == "running":
+            raise InvariantError("stuck running after the appliance went quiet")
+        for event_type, payload in hass.bus.events:
+            if payload["finished_at"] and payload["finished_at"] < payload["started_at"]:
+                raise InvariantError(f"{event_type} finished before it started")
+
+        _run(manager.async_unload())
+        if hass.live_timers or hass.live_listeners:
+            raise InvariantError(
+                f"{hass.live_timers} timers and {hass.live_listeners} "
+                "listeners left after unload"
+            )
+        return states, hass.bus.events, manager.last_runtime
+    finally:
+        restore()
+
+
+def digest(result) -> str:
+    """Return a short fingerprint of a trace result."""
+    return hashlib.sha256(repr(result).encode()).hexdigest()[:16]
+
+
+def load_golden(length: int = 60) -> dict[int, str]:
+    """Return recorded result fingerprints by seed for traces of ``length``."""
+    with GOLDEN.open() as handle:
+        golden = json.load(handle)
+    if golden["length"] != length:
+        return {}
+    return {int(seed): value for seed, value in golden["seeds"].items()}
+
+
+def check_trace(trace: dict, expected: str | None = None) -> str:
+    """Run a trace, compare it with a skewed run and the recorded result.
+
+    Returns the fingerprint of the result.
+    """
+    result = run_trace(trace)
+    skewed = run_trace(trace, fire_skew=0.75, wall_skew=3600.0)
+    if result != skewed:
+        raise InvariantError("result depends on the wall clock")
+    fingerprint = digest(result)
+    if expected is not None and fingerprint != expected:
+        raise InvariantError("result differs from the recorded reference")
+    return fingerprint
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--traces", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--length", type=int, default=60)
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="rewrite the recorded results instead of comparing with them",
+    )
+    args = parser.parse_args()
+    golden = {} if args.record else load_golden(args.length)
+    recorded = {}
+    started = time.perf_counter()
+    for index in range(args.traces):
+        seed = args.seed + index
+        trace = random_trace(random.Random(seed), args.length)
+        try:
+            recorded[seed] = check_trace(trace, golden.get(seed))
+        except InvariantError as err:
+            print(f"seed {seed}: {err}")
+            return 1
+    elapsed = time.perf_counter() - started
+    if args.record:
+        with GOLDEN.open("w") as handle:
+            json.dump(
+                {"length": args.length, "seeds": recorded}, handle, indent=0
+            )
+            handle.write("\n")
+    print(f"{args.traces} traces ok, {args.traces / elapsed:.0f} traces/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
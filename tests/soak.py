@@ -0,0 +1,309 @@
+"""Fleet soak harness for the appliance cycle manager.
+
+Sets up many config entries, each with its manager and its sensor and
+binary sensor entities, on a virtual-clock hass with simulated plug
+traffic. It reports event-loop lag, CPU per 1k events, entity state
+writes, live timers and memory per appliance at setup and after the
+run. After every entry is unloaded it checks that no timers, listeners
+or dispatcher connections are left and that managers and entities can
+be collected.
+
+    python -m tests.soak --appliances 300
+
+Time is virtual, so "loop lag" is the wall time the loop is blocked
+while one batch of simultaneous events and due timers is handled, i.e.
+the delay a real loop would add to whatever is scheduled behind it.
+Memory is traced for the whole run, so the CPU figure includes the
+tracing overhead; compare it only against other soak runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import gc
+import random
+import resource
+import time
+import tracemalloc
+import weakref
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from custom_components.appliance_cycle.const import (
+    APPLIANCE_TYPES,
+    CONF_APPLIANCE_TYPE,
+    CONF_DOOR_SENSOR,
+    CONF_POWER_SENSOR,
+    CONF_PRICE_SENSOR,
+    DOMAIN,
+)
+from .fake_hass import FakeEntry, FakeHass
+
+HISTORY_CSV = Path(__file__).resolve().parent.parent / "history (1).csv"
+START = datetime(2025, 9, 17, 16, 0, tzinfo=timezone.utc)
+PROFILES = ("idle", "standby", "cycle")
+
+
+def load_history(path: Path = HISTORY_CSV) -> list[tuple[float, float]]:
+    """Return (seconds from first sample, watts) pairs from the CSV."""
+    with path.open(newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    first = datetime.fromisoformat(rows[0]["last_changed"].replace("Z", "+00:00"))
+    samples = []
+    for row in rows:
+        changed = datetime.fromisoformat(row["last_changed"].replace("Z", "+00:00"))
+        samples.append(((changed - first).total_seconds(), float(row["state"])))
+    return samples
+
+
+def _traffic(
+    kind: str,
+    rng: random.Random,
+    history: list[tuple[float, float]],
+    duration: float,
+) -> tuple[list[tuple[float, float]], list[float]]:
+    """Return power reports and cycle power-off offsets for one profile.
+
+    Real cycles are replayed back to back with a random gap and a random
+    phase, so at any moment some appliances are starting, running or
+    waiting out their resume grace.
+    """
+    if kind == "idle":
+        return [(t, 0.3) for t in range(0, int(duration), 300)], []
+    if kind == "standby":
+        samples = []
+        t = 0.0
+        while t < duration:
+            samples.append((t, round(rng.uniform(0.0, 14.0), 1)))
+            t += rng.uniform(5, 60)
+        return samples, []
+    span = history[-1][0]
+    power_off = max(t for t, watts in history if watts > 15)
+    samples = []
+    ends = []
+    start = -rng.uniform(0, span)
+    while start < duration:
+        for t, watts in history:
+            if 0 <= start + t < duration:
+                samples.append((start + t, watts))
+        ends.append(start + power_off)
+        start += span + rng.uniform(600, 3600)
+    return samples, ends
+
+
+def _build_stream(appliances, rng, history, duration):
+    """Merge every appliance's traffic into one time-ordered stream.
+
+    Besides state writes the stream holds one reload per appliance, the
+    way an entry is reloaded after its options change. Appliances that
+    run cycles are reloaded shortly after one ends, while the finish and
+    resume grace timers are most likely to be pending.
+    """
+    stream = []
+    prices = set()
+    for index, (entity_ids, kind) in enumerate(appliances):
+        power, door, price = entity_ids
+        samples, ends = _traffic(kind, rng, history, duration)
+        for offset, watts in samples:
+            stream.append((offset, power, watts, {"unit_of_measurement": "W"}))
+        if door:
+            for end in ends:
+                opened = end + rng.uniform(300, 1200)
+                if 0 <= opened and opened + 30 < duration:
+                    stream.append((opened, door, "on", {}))
+                    stream.append((opened + 30, door, "off", {}))
+        if price:
+            prices.add(price)
+        ends = [end for end in ends if 0 < end < duration - 1200]
+        if ends:
+            reload_at = rng.choice(ends) + rng.uniform(0, 1200)
+        else:
+            reload_at = rng.uniform(0, duration)
+        stream.append((reload_at, None, index, None))
+    for price in sorted(prices):
+        for hour in range(int(duration // 3600) + 1):
+            stream.append(
+                (
+                    hour * 3600.0,
+                    price,
+                    round(rng.uniform(0.05, 0.6), 3),
+                    {"unit_of_measurement": "EUR/kWh"},
+                )
+            )
+    stream.sort(key=lambda item: item[0])
+    return stream
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _traced_bytes() -> int:
+    """Return traced memory, leaving out the harness's own bookkeeping."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, __file__)]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def run_soak(
+    appliances: int = 300, hours: float = 12.0, seed: int = 1
+) -> dict:
+    """Run the soak and return a report dict."""
+    rng = random.Random(seed)
+    history = load_history()
+    duration = hours * 3600
+    hass = FakeHass(START)
+    restore = hass.install()
+    runner = asyncio.Runner()
+    refs = []
+    entity_refs = []
+    entity_count = 0
+    leaked = 0
+
+    def _setup(index: int) -> tuple:
+        nonlocal entity_count
+        entry = entries[index]
+        owner = (index, len(refs))
+        hass.owner = owner
+        runner.run(hass.config_entries.async_setup(entry))
+        hass.owner = None
+        refs.append(weakref.ref(hass.data[DOMAIN][entry.entry_id]))
+        entities = hass.config_entries.entities(entry.entry_id)
+        entity_count += len(entities)
+        entity_refs.extend(weakref.ref(entity) for entity in entities)
+        return owner
+
+    def _unload(index: int) -> None:
+        nonlocal leaked
+        owner = owners[index]
+        hass.owner = owner
+        runner.run(hass.config_entries.async_unload(entries[index]))
+        hass.owner = None
+        leaked += hass.owned(owner)
+
+    try:
+        entries = []
+        layout = []
+        for index in range(appliances):
+            kind = PROFILES[index % len(PROFILES)]
+            power = f"sensor.appliance_{index}_power"
+            door = f"binary_sensor.appliance_{index}_door" if index % 2 else None
+            price = "sensor.electricity_price" if index % 4 == 0 else None
+            entries.append(
+                FakeEntry(
+                    f"entry_{index}",
+                    f"Appliance {index}",
+                    {
+                        CONF_APPLIANCE_TYPE: APPLIANCE_TYPES[0],
+                        CONF_POWER_SENSOR: power,
+                        CONF_DOOR_SENSOR: door,
+                        CONF_PRICE_SENSOR: price,
+                    },
+                )
+            )
+            layout.append(((power, door, price), kind))
+
+        stream = _build_stream(layout, rng, history, duration)
+        tracemalloc.start()
+        before = _traced_bytes()
+        owners = [_setup(index) for index in range(appliances)]
+        after_setup = _traced_bytes()
+        entities = entity_count
+
+        lags = []
+        max_timers = hass.live_timers
+        cpu_start = time.process_time()
+        position = 0
+        while position < len(stream):
+            offset = stream[position][0]
+            started = time.perf_counter()
+            hass.advance_to(START + timedelta(seconds=offset))
+            while position < len(stream) and stream[position][0] == offset:
+                _, entity_id, value, attributes = stream[position]
+                position += 1
+                if entity_id is None:
+                    _unload(value)
+                    owners[value] = _setup(value)
+                    continue
+                hass.set_state(entity_id, value, attributes)
+            lags.append(time.perf_counter() - started)
+            max_timers = max(max_timers, hass.live_timers)
+        cpu = time.process_time() - cpu_start
+        timers_before_unload = hass.live_timers
+        gc.collect()
+        after_run = _traced_bytes()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        for index in range(len(owners)):
+            _unload(index)
+        owners.clear()
+        gc.collect()
+
+        events = hass.state_events
+        return {
+            "appliances": appliances,
+            "reloads": len(refs) - appliances,
+            "state_events": events,
+            "bus_events": len(hass.bus.events),
+            "entities": entities,
+            "dispatches": hass.dispatched,
+            "entity_state_writes": hass.states.writes,
+            "loop_lag_ms": {
+                pct: round(_percentile(lags, pct) * 1000, 3)
+                for pct in (50, 95, 99, 100)
+            },
+            "cpu_ms_per_1k_events": round(cpu * 1000 / max(events, 1) * 1000, 1),
+            "max_live_timers": max_timers,
+            "live_timers_before_unload": timers_before_unload,
+            "memory_bytes_per_appliance_at_setup": round(
+                (after_setup - before) / max(appliances, 1)
+            ),
+            "memory_bytes_per_appliance_after_run": round(
+                (after_run - before) / max(appliances, 1)
+            ),
+            "peak_traced_memory_bytes": peak,
+            "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "leaked_timers_and_listeners": leaked,
+            "live_timers_after_unload": hass.live_timers,
+            "live_listeners_after_unload": hass.live_listeners,
+            "live_connections_after_unload": hass.live_connections,
+            "uncollected_managers": sum(ref() is not None for ref in refs),
+            "uncollected_entities": sum(
+                ref() is not None for ref in entity_refs
+            ),
+        }
+    finally:
+        runner.close()
+        restore()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--appliances", type=int, default=300)
+    parser.add_argument("--hours", type=float, default=12.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    report = run_soak(args.appliances, args.hours, args.seed)
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    leaked = (
+        report["leaked_timers_and_listeners"]
+        or report["live_timers_after_unload"]
+        or report["live_listeners_after_unload"]
+        or report["live_connections_after_unload"]
+        or report["uncollected_managers"]
+        or report["uncollected_entities"]
+    )
+    return 1 if leaked else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""Tests for the appliance cycle config and options flows."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.appliance_cycle.config_flow import (
+    ApplianceCycleConfigFlow,
+    OptionsFlowHandler,
+)
+from custom_components.appliance_cycle.const import CONF_EXTRA_SENSORS, DOMAIN
+
+from .fake_hass import FakeEntry
+
+
+def _flow() -> ApplianceCycleConfigFlow:
+    flow = ApplianceCycleConfigFlow()
+    flow.context = {}
+    flow.flow_id = "flow"
+    flow.handler = "appliance_cycle"
+    return flow
+
+
+def test_numeric_extra_sensors_get_a_settings_step():
+    flow = _flow()
+    result = asyncio.run(
+        flow.async_step_user(
+            {
+                "name": "Washer",
+                "appliance_type": "washer",
+                "power_sensor": "sensor.washer_power",
+                CONF_EXTRA_SENSORS: [
+                    "binary_sensor.washer_vibration",
+                    "sensor.washer_current",
+                ],
+            }
+        )
+    )
+    assert result["step_id"] == "source"
+    assert result["description_placeholders"] == {
+        "entity_id": "sensor.washer_current"
+    }
+
+    result = asyncio.run(flow.async_step_source({"scale": 1.0, "threshold": 0.3}))
+
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_EXTRA_SENSORS] == [
+        {"entity_id": "binary_sensor.washer_vibration"},
+        {"entity_id": "sensor.washer_current", "scale": 1.0, "threshold": 0.3},
+    ]
+
+
+def test_options_update_source_settings(hass):
+    entry = FakeEntry(
+        "entry",
+        "Washer",
+        {
+            "appliance_type": "washer",
+            "power_sensor": "sensor.washer_power",
+            "profile": {},
+            CONF_EXTRA_SENSORS: ["sensor.washer_flow"],
+        },
+    )
+    asyncio.run(hass.config_entries.async_setup(entry))
+    before = hass.data[DOMAIN][entry.entry_id]
+    flow = OptionsFlowHandler(entry)
+    flow.hass = hass
+    flow.flow_id = "flow"
+    flow.handler = "entry"
+
+    result = asyncio.run(flow.async_step_init({"delay_on": 30}))
+    assert result["step_id"] == "source"
+    result = asyncio.run(flow.async_step_source({"scale": 100.0}))
+    asyncio.run(hass.async_block_till_done())
+
+    assert result["type"] == "create_entry"
+    assert entry.data[CONF_EXTRA_SENSORS] == [
+        {"entity_id": "sensor.washer_flow", "scale": 100.0, "threshold": None}
+    ]
+    assert entry.data["profile"]["delay_on"] == 30
+    manager = hass.data[DOMAIN][entry.entry_id]
+    assert manager is not before
+    assert manager.inputs["sensor.washer_flow"].scale == 100.0
+    assert manager.profile["delay_on"] == 30
+    assert hass.live_listeners == 1
@@ -0,0 +1,120 @@
+"""Tests for per-cycle cost from a price sensor."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.appliance_cycle.const import (
+    CONF_PRICE_SENSOR,
+    EVENT_CYCLE_FINISHED,
+)
+from custom_components.appliance_cycle.inputs import (
+    price_currency,
+    price_per_kwh,
+)
+from custom_components.appliance_cycle.sensor import (
+    ApplianceCycleCostSensor,
+    ApplianceLastCycleCostSensor,
+)
+
+POWER = "sensor.washer_power"
+PRICE = "sensor.electricity_price"
+WATTS = {"unit_of_measurement": "W"}
+
+
+def _price(hass, value, unit="EUR/kWh") -> None:
+    hass.set_state(PRICE, value, {"unit_of_measurement": unit})
+
+
+def test_cost_split_across_price_changes(hass, make_manager):
+    manager = make_manager(**{CONF_PRICE_SENSOR: PRICE})
+    _price(hass, 0.10)
+    hass.set_state(POWER, 1000, WATTS)
+    hass.advance(60)
+    # Price changes inside the delay_on window, before the start is confirmed.
+    _price(hass, 0.20)
+    hass.advance(1740)
+    _price(hass, 500, "EUR/MWh")
+    hass.advance(1800)
+    hass.set_state(POWER, 0, WATTS)
+    hass.advance(420)
+
+    expected = (60 * 0.10 + 1740 * 0.20 + 1800 * 0.50) / 3600
+    (finished,) = hass.bus.of_type(EVENT_CYCLE_FINISHED)
+    assert finished["cost"] == pytest.approx(expected, abs=1e-4)
+    assert finished["cost_unit"] == "EUR"
+    assert manager.last_cost == finished["cost"]
+
+
+def test_cost_so_far_while_running(hass, make_manager):
+    manager = make_manager(**{CONF_PRICE_SENSOR: PRICE})
+    _price(hass, 0.30)
+    assert manager.cost_so_far is None
+
+    hass.set_state(POWER, 2000, WATTS)
+    hass.advance(1800)
+    assert manager.cost_so_far == pytest.approx(0.30)
+
+    hass.set_state(POWER, 0, WATTS)
+    hass.advance(420)
+    assert manager.state == "finished"
+    assert manager.cost_so_far is None
+
+
+def test_cost_sensors_have_a_stable_currency_unit(hass, make_manager):
+    manager = make_manager(**{CONF_PRICE_SENSOR: PRICE})
+    current = ApplianceCycleCostSensor(manager)
+    last = ApplianceLastCycleCostSensor(manager)
+
+    for sensor in (current, last):
+        assert sensor.device_class == "monetary"
+        assert sensor.native_unit_of_measurement == "EUR"
+        assert sensor.native_value is None
+
+    _price(hass, 0.25)
+    assert current.native_unit_of_measurement == "EUR"
+
+
+def test_price_in_other_currency_is_reported(hass, make_manager, caplog):
+    _price(hass, 0.25, "NOK/kWh")
+    make_manager(**{CONF_PRICE_SENSOR: PRICE})
+    _price(hass, 0.30, "NOK/kWh")
+
+    warnings = [
+        record for record in caplog.records if record.levelname == "WARNING"
+    ]
+    assert len(warnings) == 1
+    assert "NOK" in warnings[0].getMessage()
+    assert "EUR" in warnings[0].getMessage()
+
+
+def test_price_in_currency_sub_unit(hass, make_manager, caplog):
+    manager = make_manager(**{CONF_PRICE_SENSOR: PRICE})
+    _price(hass, 25, "c/kWh")
+    hass.set_state(POWER, 2000, WATTS)
+    hass.advance(1800)
+
+    assert manager.cost_so_far == pytest.approx(0.25)
+    assert not caplog.records
+
+
+@pytest.mark.parametrize(
+    ("unit", "per_kwh", "currency"),
+    [
+        ("EUR/kWh", 0.5, "EUR"),
+        ("nok/kWh", 0.5, "NOK"),
+        ("EUR/MWh", 0.0005, "EUR"),
+        ("EUR/Wh", 500.0, "EUR"),
+        ("c/kWh", 0.005, None),
+        ("øre/kWh", 0.005, None),
+        ("€/kWh", 0.5, None),
+        (None, 0.5, None),
+    ],
+)
+def test_price_units(unit, per_kwh, currency):
+    attributes = {"unit_of_measurement": unit} if unit else {}
+    state = State(PRICE, "0.5", attributes)
+
+    assert price_per_kwh(state) == pytest.approx(per_kwh)
+    assert price_currency(state) == currency
@@ -0,0 +1,112 @@
+"""Tests for cycle lifecycle events and energy accounting."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.appliance_cycle.const import (
+    CONF_DOOR_SENSOR,
+    EVENT_CYCLE_ABORTED,
+    EVENT_CYCLE_DOOR_OPENED,
+    EVENT_CYCLE_FINISHED,
+    EVENT_CYCLE_STARTED,
+)
+
+from .conftest import START
+
+POWER = "sensor.washer_power"
+DOOR = "binary_sensor.washer_door"
+WATTS = {"unit_of_measurement": "W"}
+
+
+def _iso(seconds: float) -> str:
+    return (START + timedelta(seconds=seconds)).isoformat()
+
+
+def test_start_and_finish_payloads(hass, make_manager):
+    make_manager()
+    hass.set_state(POWER, 100, WATTS)
+    hass.advance(60)
+    hass.set_state(POWER, 1000, WATTS)
+    hass.advance(30)
+
+    (started,) = hass.bus.of_type(EVENT_CYCLE_STARTED)
+    assert started == {
+        "entry_id": "washer_entry",
+        "name": "Washer",
+        "appliance_type": "washer",
+        "started_at": _iso(0),
+        "finished_at": None,
+        "runtime_seconds": None,
+        "energy_kwh": round((100 * 60 + 1000 * 30) / 3600 / 1000, 4),
+        "cost": None,
+        "cost_unit": None,
+        "end_reason": None,
+    }
+
+    hass.advance(1710)
+    hass.set_state(POWER, 0, WATTS)
+    hass.advance(420)
+
+    (finished,) = hass.bus.of_type(EVENT_CYCLE_FINISHED)
+    assert finished["started_at"] == _iso(0)
+    assert finished["finished_at"] == _iso(2220)
+    assert finished["runtime_seconds"] == 2220
+    assert finished["end_reason"] == "power_off"
+    assert finished["energy_kwh"] == pytest.approx(
+        (100 * 60 + 1000 * 1740) / 3600 / 1000, abs=1e-4
+    )
+
+
+def test_delay_on_window_is_integrated_as_it_happens(hass, make_manager):
+    manager = make_manager()
+    hass.set_state(POWER, 20, WATTS)
+    hass.advance(89)
+    hass.set_state(POWER, 2000, WATTS)
+    hass.advance(1)
+
+    assert manager.state == "running"
+    assert manager.cycle_energy_wh == pytest.approx((20 * 89 + 2000) / 3600)
+
+
+def test_door_opened_after_finish_payload(hass, make_manager):
+    make_manager(**{CONF_DOOR_SENSOR: DOOR})
+    hass.set_state(DOOR, "off")
+    hass.set_state(POWER, 500, WATTS)
+    hass.advance(1800)
+    hass.set_state(POWER, 0, WATTS)
+    hass.advance(600)
+    hass.set_state(DOOR, "on")
+
+    (finished,) = hass.bus.of_type(EVENT_CYCLE_FINISHED)
+    (opened,) = hass.bus.of_type(EVENT_CYCLE_DOOR_OPENED)
+    assert opened == {**finished, "door_opened_at": _iso(2400)}
+
+
+def test_door_ends_running_cycle(hass, make_manager):
+    manager = make_manager(**{CONF_DOOR_SENSOR: DOOR})
+    hass.set_state(DOOR, "off")
+    hass.set_state(POWER, 500, WATTS)
+    hass.advance(900)
+    hass.set_state(DOOR, "on")
+
+    (finished,) = hass.bus.of_type(EVENT_CYCLE_FINISHED)
+    assert finished["end_reason"] == "door_opened"
+    assert finished["finished_at"] == _iso(900)
+    assert manager.state == "finished"
+
+
+def test_short_cycle_fires_aborted(hass, make_manager):
+    manager = make_manager(profile={"min_run": 3600})
+    hass.set_state(POWER, 500, WATTS)
+    hass.advance(600)
+    hass.set_state(POWER, 0, WATTS)
+    hass.advance(420)
+
+    assert hass.bus.of_type(EVENT_CYCLE_FINISHED) == []
+    (aborted,) = hass.bus.of_type(EVENT_CYCLE_ABORTED)
+    assert aborted["runtime_seconds"] == 1020
+    assert aborted["end_reason"] == "power_off"
+    assert manager.state == "idle"
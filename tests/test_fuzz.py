@@ -0,0 +1,64 @@
+"""Randomised invariant checks for the cycle state machine."""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+from custom_components.appliance_cycle.const import (
+    CONF_DOOR_SENSOR,
+    EVENT_CYCLE_ABORTED,
+    EVENT_CYCLE_FINISHED,
+)
+
+from .fuzz import check_trace, load_golden, random_trace
+
+TRACES = int(os.environ.get("APPLIANCE_FUZZ_TRACES", "1000"))
+GOLDEN = load_golden()
+
+
+@pytest.mark.parametrize("block", range(10))
+def test_random_traces_keep_invariants(block):
+    for seed in range(block, TRACES, 10):
+        check_trace(random_trace(random.Random(seed)), GOLDEN.get(seed))
+
+
+def test_golden_covers_default_traces():
+    assert set(range(1000)) <= set(GOLDEN)
+
+
+def test_float_rounding_does_not_stall_start(hass, make_manager):
+    # 20.920835 + 26.388695 + 7.69047 s of high power sums to just under
+    # the 55 s delay_on in floating point.
+    manager = make_manager(
+        profile={"delay_on": 55, "start_grace": 0, "on_threshold": 3.0}
+    )
+    hass.set_state("sensor.washer_power", 7.3, {"unit_of_measurement": "W"})
+    hass.advance(20.920835)
+    hass.set_state("sensor.washer_power", 7.4, {"unit_of_measurement": "W"})
+    hass.advance(26.388695)
+    hass.set_state("sensor.washer_power", 7.5, {"unit_of_measurement": "W"})
+    hass.advance(10)
+
+    assert manager.state == "running"
+
+
+def test_attribute_only_door_update_is_ignored(hass, make_manager):
+    manager = make_manager(
+        **{CONF_DOOR_SENSOR: "binary_sensor.washer_door"},
+        profile={"min_run": 0},
+    )
+    hass.set_state("binary_sensor.washer_door", "on")
+    hass.advance(100)
+    hass.set_state("sensor.washer_power", 500, {"unit_of_measurement": "W"})
+    hass.advance(3600)
+    assert manager.state == "running"
+
+    hass.set_state("binary_sensor.washer_door", "on", {"battery": 80})
+
+    assert manager.state == "running"
+    assert not hass.bus.of_type(EVENT_CYCLE_ABORTED)
+    assert not hass.bus.of_type(EVENT_CYCLE_FINISHED)
+
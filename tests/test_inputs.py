@@ -0,0 +1,97 @@
+"""Tests for multi-signal input fusion."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import State
+
+from custom_components.appliance_cycle.const import (
+    CONF_DOOR_SENSOR,
+    CONF_EXTRA_SENSORS,
+    CONF_PRICE_SENSOR,
+)
+from custom_components.appliance_cycle.inputs import (
+    ROLE_SIGNAL,
+    InputSource,
+    build_sources,
+)
+
+WATTS = {"unit_of_measurement": "W"}
+VIBRATION = "binary_sensor.washer_vibration"
+CLAMP = "sensor.washer_current"
+
+
+def test_build_sources_skips_bad_settings():
+    sources = build_sources(
+        "sensor.power",
+        None,
+        None,
+        [
+            {"entity_id": CLAMP, "scale": "abc", "threshold": -1},
+            {"scale": 2},
+            {"entity_id": "sensor.power"},
+            VIBRATION,
+        ],
+    )
+
+    assert list(sources) == ["sensor.power", CLAMP, VIBRATION]
+    assert sources[CLAMP].role == ROLE_SIGNAL
+    assert sources[CLAMP].scale is None
+    assert sources[CLAMP].threshold is None
+
+
+def test_numeric_source_scale_and_threshold():
+    scaled = InputSource(CLAMP, ROLE_SIGNAL, scale=230.0)
+    gated = InputSource(CLAMP, ROLE_SIGNAL, threshold=0.3)
+
+    assert scaled.value(State(CLAMP, "0.5"), 15.0) == 115.0
+    assert gated.value(State(CLAMP, "0.5"), 15.0) == 15.0
+    assert gated.value(State(CLAMP, "0.1"), 15.0) == 0.0
+    assert gated.value(State(CLAMP, "n/a"), 15.0) is None
+
+
+def test_extra_sensor_alone_starts_and_stops_cycle(hass, make_manager):
+    manager = make_manager(
+        **{CONF_EXTRA_SENSORS: [{"entity_id": CLAMP, "threshold": 0.3}]}
+    )
+    hass.set_state("sensor.washer_power", 0, WATTS)
+
+    hass.set_state(CLAMP, 1.2, {"unit_of_measurement": "A"})
+    hass.advance(120)
+    assert manager.state == "running"
+
+    hass.advance(1800)
+    hass.set_state(CLAMP, 0.05, {"unit_of_measurement": "A"})
+    hass.advance(420)
+    assert manager.state == "finished"
+    assert manager.cycle_energy_wh == 0.0
+
+
+def test_unavailable_source_drops_out_of_signal(hass, make_manager):
+    manager = make_manager(**{CONF_EXTRA_SENSORS: [VIBRATION]})
+    hass.set_state("sensor.washer_power", 500, WATTS)
+    hass.set_state(VIBRATION, "on")
+    hass.advance(1800)
+    hass.set_state("sensor.washer_power", 1, WATTS)
+    assert manager.state == "running"
+
+    hass.set_state(VIBRATION, "unavailable")
+    hass.advance(420)
+
+    assert manager.state == "finished"
+
+
+def test_one_listener_for_all_sources(hass, make_manager):
+    manager = make_manager(
+        **{
+            CONF_DOOR_SENSOR: "binary_sensor.washer_door",
+            CONF_PRICE_SENSOR: "sensor.price",
+            CONF_EXTRA_SENSORS: [VIBRATION, CLAMP],
+        }
+    )
+
+    assert hass.live_listeners == 1
+    asyncio.run(manager.async_unload())
+    assert hass.live_listeners == 0
+    assert hass.live_timers == 0
@@ -0,0 +1,81 @@
+"""Leak checks for the appliance cycle manager."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.appliance_cycle.const import CONF_DOOR_SENSOR
+
+from .fake_hass import FakeEntry
+from .soak import run_soak
+
+
+def _run_cycle(hass, watts: float = 500.0) -> None:
+    hass.set_state("sensor.washer_power", watts, {"unit_of_measurement": "W"})
+    hass.advance(1800)
+    hass.set_state("sensor.washer_power", 1, {"unit_of_measurement": "W"})
+    hass.advance(500)
+
+
+def test_unload_during_resume_grace_cancels_reset(hass, make_manager):
+    manager = make_manager()
+    _run_cycle(hass)
+    assert manager.state == "finished"
+
+    asyncio.run(manager.async_unload())
+
+    assert hass.live_timers == 0
+    assert hass.live_listeners == 0
+
+
+def test_unload_with_door_leaves_nothing(hass, make_manager):
+    manager = make_manager(**{CONF_DOOR_SENSOR: "binary_sensor.washer_door"})
+    hass.set_state("binary_sensor.washer_door", "off")
+    _run_cycle(hass)
+    hass.set_state("binary_sensor.washer_door", "on")
+    hass.set_state("sensor.washer_power", 500, {"unit_of_measurement": "W"})
+
+    asyncio.run(manager.async_unload())
+
+    assert hass.live_timers == 0
+    assert hass.live_listeners == 0
+
+
+def test_entry_unload_disconnects_entities(hass):
+    entry = FakeEntry(
+        "washer_entry",
+        "Washer",
+        {
+            "appliance_type": "washer",
+            "power_sensor": "sensor.washer_power",
+            CONF_DOOR_SENSOR: "binary_sensor.washer_door",
+        },
+    )
+    asyncio.run(hass.config_entries.async_setup(entry))
+    assert hass.live_connections == len(
+        hass.config_entries.entities(entry.entry_id)
+    )
+    _run_cycle(hass)
+    assert hass.states.get("binary_sensor.washer_running").state == "off"
+    assert hass.states.get("sensor.washer_status").state == "Finished"
+
+    asyncio.run(hass.config_entries.async_unload(entry))
+
+    assert hass.live_timers == 0
+    assert hass.live_listeners == 0
+    assert hass.live_connections == 0
+    assert hass.states.get("sensor.washer_status") is None
+
+
+def test_soak_fleet_leaves_nothing_behind():
+    report = run_soak(appliances=30, hours=8)
+
+    assert report["reloads"] == 30
+    assert report["bus_events"] > 0
+    assert report["leaked_timers_and_listeners"] == 0
+    assert report["live_timers_after_unload"] == 0
+    assert report["live_listeners_after_unload"] == 0
+    assert report["live_connections_after_unload"] == 0
+    assert report["uncollected_managers"] == 0
+    assert report["uncollected_entities"] == 0
+    assert report["entity_state_writes"] > report["entities"]